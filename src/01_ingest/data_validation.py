@@ -1,99 +1,256 @@
 from __future__ import annotations
+from typing import Optional
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from schemas import FILLS, PRICES, FEES
 
 class DataValidationError(ValueError):
     pass
 
-def require_columns(df: pd.DataFrame, required_cols: tuple, name: str) -> None:
-    missing = [c for c in required_cols if c not in df.columns]
+# Sign scans over float64 arrays (NaN fails every comparison).
+def _all_positive(a: np.ndarray) -> bool:
+    return bool((a > 0).all())
+
+def _all_nonpositive(a: np.ndarray) -> bool:
+    return bool((a <= 0).all())
+
+def _all_nonnegative(a: np.ndarray) -> bool:
+    return bool((a >= 0).all())
+
+def require_columns(
+    df: pd.DataFrame,
+    required_cols: tuple,
+    name: str,
+    required_set: Optional[frozenset] = None,
+) -> None:
+    if required_set is None:
+        required_set = frozenset(required_cols)
+    missing = required_set.difference(df.columns)
     if missing:
+        missing = [c for c in required_cols if c in missing]  # report in schema order
         raise DataValidationError(f"{name}: missing required columns: {missing}")
 
+def _as_float(s: pd.Series) -> pd.Series:
+    if not pd.api.types.is_float_dtype(s.dtype):
+        s = pd.to_numeric(s, errors="coerce")
+    # numpy float64: Arrow keeps NaN distinct from null, isna() would miss it
+    return s.astype(np.float64)
+
+# canonical timestamp type returned by normalize_* for every input
+UTC_TIMESTAMP = pa.timestamp("us", tz="UTC")
+
+def _parse_timestamp_utc(s: pd.Series) -> pd.Series:
+    if isinstance(s.dtype, pd.ArrowDtype) and s.dtype.pyarrow_dtype == UTC_TIMESTAMP:
+        return s
+
+    arr = None
+    if pd.api.types.is_datetime64_any_dtype(s.dtype):
+        arr = pa.array(s)
+    elif pd.api.types.is_string_dtype(s):
+        # ISO-8601 parsed in Arrow's C++ cast: strings with an offset first,
+        # then naive strings (read as UTC wall time, as utc=True did)
+        text = _arrow_str(s)
+        for target in (UTC_TIMESTAMP, pa.timestamp("us")):
+            try:
+                arr = pc.cast(text, target)
+                break
+            except pa.ArrowInvalid:
+                pass
+    if arr is None:
+        # mixed/unusual layouts and bad values: pandas, per value (a format
+        # inferred from the first value would NaT the rest), coerce-to-NaT
+        arr = pa.array(pd.to_datetime(s, errors="coerce", utc=True, format="mixed"))
+
+    # naive -> UTC, other zones -> same instant in UTC, ns -> us
+    arr = pc.cast(arr, UTC_TIMESTAMP, safe=False)
+    return pd.Series(pd.arrays.ArrowExtensionArray(arr), index=s.index, name=s.name)
+
+# canonical date type returned by normalize_prices for every input
+DATE = pa.date32()
+
+def _as_date(s: pd.Series) -> pd.Series:
+    if isinstance(s.dtype, pd.ArrowDtype) and s.dtype.pyarrow_dtype == DATE:
+        return s
+
+    arr = None
+    if pd.api.types.is_string_dtype(s):
+        # ISO dates in Arrow's C++ cast
+        try:
+            arr = pc.cast(_arrow_str(s), DATE)
+        except pa.ArrowInvalid:
+            pass
+    if arr is None:
+        # datetimes and other layouts: pandas with coerce-to-NaT, then the
+        # calendar date in the value's own zone
+        dt = pa.array(pd.to_datetime(s, errors="coerce"))
+        if getattr(dt.type, "tz", None) is not None:
+            dt = pc.local_timestamp(dt)
+        arr = pc.cast(dt, DATE, safe=False)
+
+    return pd.Series(pd.arrays.ArrowExtensionArray(arr), index=s.index, name=s.name)
+
+def _arrow_str(s: pd.Series) -> pa.ChunkedArray:
+    # Arrow-backed columns are used as-is (zero-copy)
+    if isinstance(s.dtype, pd.ArrowDtype):
+        arr = pa.array(s)
+    else:
+        arr = pa.array(s.astype("string"))
+    if isinstance(arr, pa.Array):
+        arr = pa.chunked_array([arr])
+    return arr if arr.type == pa.string() else arr.cast(pa.string())
+
+def _strip(s: pd.Series) -> pd.Series:
+    arr = pc.utf8_trim_whitespace(_arrow_str(s))
+    return pd.Series(pd.arrays.ArrowExtensionArray(arr), index=s.index, name=s.name)
+
+def _strip_upper(s: pd.Series) -> pd.Series:
+    arr = pc.utf8_upper(pc.utf8_trim_whitespace(_arrow_str(s)))
+    return pd.Series(pd.arrays.ArrowExtensionArray(arr), index=s.index, name=s.name)
+
+SIDE_CATEGORIES = ["B", "S"]
+
+def _encode_side(s: pd.Series) -> pd.Series:
+    # 'B'/'S' as a categorical over int8 codes (B=0, S=1); still reads as strings
+    if isinstance(s.dtype, pd.CategoricalDtype) and list(s.cat.categories) == SIDE_CATEGORIES:
+        return s
+    arr = pc.utf8_upper(pc.utf8_trim_whitespace(_arrow_str(s)))
+    codes = pc.if_else(pc.equal(arr, "B"), 0, pc.if_else(pc.equal(arr, "S"), 1, -1))
+    codes = pc.fill_null(codes, -1).cast(pa.int8()).to_numpy()
+
+    if (codes < 0).any():
+        # keep unknown values as extra categories so validate_fills can name them
+        vals  = pd.Series(pd.arrays.ArrowExtensionArray(arr))
+        extra = [v for v in vals.dropna().unique() if v not in SIDE_CATEGORIES]
+        cat   = pd.Categorical(vals, categories=SIDE_CATEGORIES + extra)
+    else:
+        cat = pd.Categorical.from_codes(codes, categories=SIDE_CATEGORIES)
+    return pd.Series(cat, index=s.index, name=s.name)
+
+def _has_empty_or_null(s: pd.Series) -> bool:
+    # empty string <=> equal neighbouring offsets; no per-cell Python objects
+    for chunk in _arrow_str(s).chunks:
+        if chunk.null_count:
+            return True
+        offsets = np.frombuffer(chunk.buffers()[1], dtype=np.int32)
+        offsets = offsets[chunk.offset : chunk.offset + len(chunk) + 1]
+        if (offsets[1:] == offsets[:-1]).any():
+            return True
+    return False
+
 def normalize_fills(df: pd.DataFrame) -> pd.DataFrame:
-    require_columns(df, FILLS.required_cols, "fills")
-    out = df.copy()
+    require_columns(df, FILLS.required_cols, "fills", FILLS.required_set)
+    # new frame over the existing column buffers; only rewritten columns allocate
+    out = dict(df.items())
+
+    out["trade_id"] = _strip(df["trade_id"])
+    out["symbol"]   = _strip_upper(df["symbol"])
+    out["side"]     = _encode_side(df["side"])
 
-    out["trade_id"] = out["trade_id"].astype(str).str.strip()
-    out["symbol"]   = out["symbol"].astype(str).str.strip().str.upper()
-    out["side"]     = out["side"].astype(str).str.strip().str.upper()
+    out["qty"]       = _as_float(df["qty"])
+    out["price"]     = _as_float(df["price"])
+    out["timestamp"] = _parse_timestamp_utc(df["timestamp"])
 
-    out["qty"]       = pd.to_numeric(out["qty"], errors="coerce")
-    out["price"]     = pd.to_numeric(out["price"], errors="coerce")
-    out["timestamp"] = pd.to_datetime(out["timestamp"], errors="coerce", utc=True)
+    return pd.DataFrame(out, copy=False)
 
-    return out
+def _side_ok(side: pd.Series) -> np.ndarray:
+    if isinstance(side.dtype, pd.CategoricalDtype) and list(side.cat.categories[:2]) == SIDE_CATEGORIES:
+        codes = side.cat.codes.to_numpy()
+        return (codes == 0) | (codes == 1)
+    return side.isin(SIDE_CATEGORIES).to_numpy()
 
 def validate_fills(df: pd.DataFrame) -> None:
-    require_columns(df, FILLS.required_cols, "fills")
+    require_columns(df, FILLS.required_cols, "fills", FILLS.required_set)
 
     # trade_id non-empty
     tid = df["trade_id"]
-    if tid.isna().any() or (tid.astype(str).str.len() == 0).any():
+    if _has_empty_or_null(tid):
         raise DataValidationError("fills: trade_id has empty/NaN values")
 
-    # trade_id unique
-    dups = tid[tid.duplicated()].unique()
-    if len(dups) > 0:
+    # trade_id unique (dup list only built on failure)
+    if not tid.is_unique:
+        counts = tid.value_counts()
+        dups = counts[counts > 1].index.tolist()
         raise DataValidationError(f"fills: duplicate trade_ids: {dups}")
 
+    # timestamp/side/qty/price checked in one go;
+    # the per-reason checks below only run when something is bad
+    ts_na   = df["timestamp"].isna().to_numpy()
+    side_ok = _side_ok(df["side"])
+    qty     = df["qty"].to_numpy(dtype=np.float64, na_value=np.nan)
+    price   = df["price"].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    if _all_positive(qty) and _all_positive(price) and side_ok.all() and not ts_na.any():
+        return
+
     # timestamp parseable
-    if df["timestamp"].isna().any():
+    if ts_na.any():
         raise DataValidationError("fills: timestamp has unparsable values")
 
     # side valid
-    mask = df["side"].isin(["B", "S"])
-    if not mask.all():
-        bad_side = df.loc[~mask, "side"].unique()
+    if not side_ok.all():
+        bad_side = df.loc[~side_ok, "side"].unique()
         raise DataValidationError(f"fills: wrong or missing side values: {bad_side.tolist()}")
 
     # qty valid
-    if df["qty"].isna().any() or (df["qty"] <= 0).any():
+    if not _all_positive(qty):
         raise DataValidationError("fills: qty must be numeric and > 0")
 
     # price valid
-    if df["price"].isna().any() or (df["price"] <= 0).any():
-        raise DataValidationError("fills: price must be numeric and > 0")
+    raise DataValidationError("fills: price must be numeric and > 0")
 
 def normalize_prices(df: pd.DataFrame) -> pd.DataFrame:
-    require_columns(df, PRICES.required_cols, "prices")
-    out = df.copy()
-
-    out["symbol"] = out["symbol"].astype(str).str.strip().str.upper()
-    out["date"]   = pd.to_datetime(out["date"], errors="coerce").dt.date
-    out["close"]  = pd.to_numeric(out["close"], errors="coerce")
+    require_columns(df, PRICES.required_cols, "prices", PRICES.required_set)
+    out = dict(df.items())
 
-    if "timestamp" in out.columns:
-        out["timestamp"] = pd.to_datetime(out["timestamp"], errors="coerce", utc=True)
+    out["symbol"]    = _strip_upper(df["symbol"])
+    out["date"]      = _as_date(df["date"])
+    out["close"]     = _as_float(df["close"])
+    out["timestamp"] = _parse_timestamp_utc(df["timestamp"])
 
-    return out
+    return pd.DataFrame(out, copy=False)
 
 def validate_prices(df: pd.DataFrame) -> None:
-    require_columns(df, PRICES.required_cols, "prices")
+    require_columns(df, PRICES.required_cols, "prices", PRICES.required_set)
 
     if df["date"].isna().any():
         raise DataValidationError("prices: date has unparsable values")
 
-    sym = df["symbol"]
-    if sym.isna().any() or (sym.astype(str).str.len() == 0).any():
+    if _has_empty_or_null(df["symbol"]):
         raise DataValidationError("prices: symbol has empty/NaN values")
 
-    if df["close"].isna().any() or (df["close"] <= 0).any():
+    if not _all_positive(df["close"].to_numpy(dtype=np.float64, na_value=np.nan)):
         raise DataValidationError("prices: close must be numeric and > 0")
 
     if df.duplicated(subset=["date", "symbol"]).any():
         raise DataValidationError("prices: duplicate rows for (date, symbol)")
 
+def normalize_fees(df: pd.DataFrame) -> pd.DataFrame:
+    # header names arrive in mixed case/padding; match them case-insensitively
+    cols = pd.DataFrame({str(c).strip().lower(): s for c, s in df.items()}, copy=False)
+    require_columns(cols, FEES.required_cols, "fees", FEES.required_set)
+
+    out = {
+        "trade_id": _strip(cols["trade_id"]),
+        "fees":     _as_float(cols["fees"]),
+        "rebates":  _as_float(cols["rebates"]),
+    }
+    return pd.DataFrame(out, copy=False)
+
 def validate_fees(df: pd.DataFrame) -> None:
-    require_columns(df, FEES.required_cols, "fees")
+    require_columns(df, FEES.required_cols, "fees", FEES.required_set)
 
-    if df["trade_id"].isna().any() or (df["trade_id"].astype(str).str.len() == 0).any():
+    if _has_empty_or_null(df["trade_id"]):
         raise DataValidationError("fees: trade_id has empty/NaN values")
 
-    fees = pd.to_numeric(df["fees"], errors="coerce")
-    if fees.isna().any() or (fees > 0).any():
+    # NaN fails either comparison, so no separate isna() pass
+    fees    = _as_float(df["fees"]).to_numpy()
+    rebates = _as_float(df["rebates"]).to_numpy()
+    if _all_nonpositive(fees) and _all_nonnegative(rebates):
+        return
+
+    if not _all_nonpositive(fees):
         raise DataValidationError("fees: fees contain NaNs or are the wrong sign")
 
-    rebates = pd.to_numeric(df["rebates"], errors="coerce")
-    if rebates.isna().any() or (rebates < 0).any():
-        raise DataValidationError("fees: rebates contain NaNs or are the wrong sign")
\ No newline at end of file
+    raise DataValidationError("fees: rebates contain NaNs or are the wrong sign")
\ No newline at end of file
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional, Sequence, Tuple
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as papq
 
 from data_validation import (
     DataValidationError,
     normalize_fills, validate_fills,
     normalize_prices, validate_prices,
-    validate_fees,
+    normalize_fees, validate_fees,
 )
 from schemas import FILLS, PRICES, FEES
 
@@ -17,21 +21,169 @@ from schemas import FILLS, PRICES, FEES
 # -----------------------------
 # Generic reader (FIXED)
 # -----------------------------
-def read_any(path: Path) -> pd.DataFrame:
+# Per-schema CSV column types: one typed parse, no inference pass, and
+# normalize_* casts become no-ops. timestamp is read as text because the CSV
+# reader can't take both naive and offset timestamps into one type;
+# _parse_timestamp_utc handles both. Malformed files (e.g. non-numeric qty)
+# fall back to inference for the non-text columns so normalize_* can coerce
+# and validate_* can report.
+_FILLS_READ_TYPES = {
+    "trade_id": pa.string(),
+    "timestamp": pa.string(),
+    "symbol": pa.string(),
+    "side": pa.string(),
+    "qty": pa.float64(),
+    "price": pa.float64(),
+}
+
+_PRICES_READ_TYPES = {
+    "date": pa.date32(),
+    "symbol": pa.string(),
+    "close": pa.float64(),
+    "timestamp": pa.string(),
+}
+
+_FEES_READ_TYPES = {
+    "trade_id": pa.string(),
+    "fees": pa.float64(),
+    "rebates": pa.float64(),
+}
+
+
+# file-level key/value marker stamped by write_parquet()
+NORMALIZED_BY = b"ingest@v1"
+
+
+def _to_pandas(tbl: pa.Table) -> pd.DataFrame:
+    return tbl.to_pandas(types_mapper=pd.ArrowDtype, split_blocks=True, self_destruct=True)
+
+
+def _sorted_by(meta: papq.FileMetaData, col: str) -> bool:
+    """
+    True when every row group declares `col` as its ascending sort key and the
+    row-group min/max statistics don't overlap, i.e. the file is globally sorted.
+    """
+    if col not in meta.schema.names:
+        return False
+    idx = meta.schema.names.index(col)
+
+    prev_max = None
+    for i in range(meta.num_row_groups):
+        rg = meta.row_group(i)
+        keys = rg.sorting_columns
+        if not keys or keys[0].column_index != idx or keys[0].descending:
+            return False
+        stats = rg.column(idx).statistics
+        if stats is None or not stats.has_min_max or stats.null_count:
+            return False
+        if prev_max is not None and stats.min < prev_max:
+            return False
+        prev_max = stats.max
+    return True
+
+
+def read_any(
+    path: Path,
+    *,
+    columns: Optional[Sequence[str]] = None,
+    schema_hint: Optional[Dict[str, pa.DataType]] = None,
+) -> pd.DataFrame:
+    """
+    Reads CSV/Parquet with the PyArrow readers into Arrow-backed pandas columns.
+    `columns` prunes Parquet reads; requested columns missing from the file are
+    skipped so require_columns() can report them. `schema_hint` gives CSV column
+    types (e.g. _FILLS_READ_TYPES); hinted columns absent from the file are ignored.
+
+    Files written by write_parquet() are tagged with df.attrs["trusted"] = True,
+    and those also proven sorted by timestamp (see _sorted_by) with
+    df.attrs["presorted"] = "timestamp". Sorting metadata from other writers
+    is ignored: only write_parquet() checks the order inside a row group.
+    """
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
     suf = path.suffix.lower()  # includes leading dot: ".csv", ".parquet"
     if suf == ".csv":
-        return pd.read_csv(path)
+        try:
+            tbl = pacsv.read_csv(
+                path, convert_options=pacsv.ConvertOptions(column_types=schema_hint or {})
+            )
+        except pa.ArrowInvalid:
+            # keep the text hints (they can't fail, and stop ids/timestamps
+            # being inferred); the failing typed columns are inferred instead
+            text = {c: t for c, t in (schema_hint or {}).items() if t == pa.string()}
+            tbl = pacsv.read_csv(
+                path, convert_options=pacsv.ConvertOptions(column_types=text)
+            )
+        return _to_pandas(tbl)
 
     if suf == ".parquet":
-        return pd.read_parquet(path)
+        # memory-mapped: pages are faulted in from the page cache on demand,
+        # and only the projected columns' pages are touched
+        with pa.memory_map(str(path), "r") as source:
+            pf = papq.ParquetFile(source)
+            if columns is not None:
+                available = set(pf.schema_arrow.names)
+                columns = [c for c in columns if c in available]
+            df = _to_pandas(pf.read(columns=columns, use_threads=True))
+            if (pf.metadata.metadata or {}).get(b"normalized_by") == NORMALIZED_BY:
+                df.attrs["trusted"] = True
+                if _sorted_by(pf.metadata, "timestamp"):
+                    df.attrs["presorted"] = "timestamp"
+        return df
 
     raise ValueError(f"Unsupported document type: {suf}")
 
 
+def _validator_for(df: pd.DataFrame) -> Optional[Callable[[pd.DataFrame], None]]:
+    cols = set(df.columns)
+    for schema, validate in (
+        (FILLS, validate_fills),
+        (PRICES, validate_prices),
+        (FEES, validate_fees),
+    ):
+        if schema.required_set <= cols:
+            return validate
+    return None
+
+
+def write_parquet(
+    df: pd.DataFrame,
+    path: Path,
+    *,
+    sorted_by: Optional[str] = None,
+    row_group_size: Optional[int] = None,
+) -> None:
+    """
+    Writes loader output to Parquet stamped with normalized_by=ingest@v1, so
+    the load_* functions skip re-validating it when it is read back.
+    `sorted_by` records the column the frame is sorted on (e.g. "timestamp"
+    for load_fills output) so the read can skip the sort as well.
+
+    The stamp is only written for frames that pass the matching validate_*
+    (picked by columns); anything else raises DataValidationError. A frame
+    not in ascending `sorted_by` order raises ValueError.
+    """
+    validate = _validator_for(df)
+    if validate is None:
+        raise DataValidationError(
+            f"write_parquet: columns {list(df.columns)} match no fills/prices/fees schema"
+        )
+    validate(df)
+
+    tbl = pa.Table.from_pandas(df, preserve_index=False)
+    tbl = tbl.replace_schema_metadata(
+        {**(tbl.schema.metadata or {}), b"normalized_by": NORMALIZED_BY}
+    )
+    sorting = None
+    if sorted_by is not None:
+        if not df[sorted_by].is_monotonic_increasing:
+            raise ValueError(f"write_parquet: frame is not sorted by {sorted_by!r}")
+        sorting = [papq.SortingColumn(tbl.schema.get_field_index(sorted_by))]
+    papq.write_table(tbl, path, row_group_size=row_group_size, sorting_columns=sorting)
+
+
 # -----------------------------
 # Loaders
 # -----------------------------
@@ -41,9 +193,12 @@ def load_fills(path: Path, *, tz: Optional[str] = None) -> pd.DataFrame:
     returns canonical columns (FILLS.required_cols) and sorted by timestamp.
 
     Expected columns (after normalization):
-      trade_id, timestamp (UTC), symbol, side ('B'/'S'), qty (>0), price (>0)
+      trade_id, timestamp (UTC), symbol, side ('B'/'S' categorical, int8 codes),
+      qty (>0), price (>0)
     """
-    df = read_any(path)
+    df = read_any(path, columns=FILLS.required_cols, schema_hint=_FILLS_READ_TYPES)
+    presorted = df.attrs.get("presorted") == "timestamp"
+    trusted = df.attrs.get("trusted", False)
 
     # normalize
     df = normalize_fills(df)
@@ -54,12 +209,14 @@ def load_fills(path: Path, *, tz: Optional[str] = None) -> pd.DataFrame:
             df["timestamp"] = df["timestamp"].dt.tz_localize("UTC")
         df["timestamp"] = df["timestamp"].dt.tz_convert(tz)
 
-    # validate
-    validate_fills(df)
+    # validate (skipped for our own normalized Parquet)
+    if not trusted:
+        validate_fills(df)
 
-    # keep canonical cols + sort
-    out = df.loc[:, list(FILLS.required_cols)].copy()
-    out = out.sort_values("timestamp").reset_index(drop=True)
+    # keep canonical cols + sort (skipped when already in timestamp order)
+    out = df[list(FILLS.required_cols)]
+    if not (presorted or out["timestamp"].is_monotonic_increasing):
+        out = out.sort_values("timestamp").reset_index(drop=True)
     return out
 
 
@@ -70,9 +227,10 @@ def load_prices(path: Path, *, tz: Optional[str] = None) -> pd.DataFrame:
     Expected columns:
       date, symbol, close, timestamp (optional but in schema)
     Note: your schema requires "timestamp". If your prices file truly doesn't have it,
-    either add it or remove it from PricesSchema.required_cols.
+    either add it or remove it from schemas.PRICES_REQUIRED_COLS.
     """
-    df = read_any(path)
+    df = read_any(path, columns=PRICES.required_cols, schema_hint=_PRICES_READ_TYPES)
+    trusted = df.attrs.get("trusted", False)
     df = normalize_prices(df)
 
     # optional tz convert if timestamp exists and is tz-aware/UTC
@@ -82,9 +240,10 @@ def load_prices(path: Path, *, tz: Optional[str] = None) -> pd.DataFrame:
                 df["timestamp"] = df["timestamp"].dt.tz_localize("UTC")
             df["timestamp"] = df["timestamp"].dt.tz_convert(tz)
 
-    validate_prices(df)
+    if not trusted:
+        validate_prices(df)
 
-    out = df.loc[:, list(PRICES.required_cols)].copy()
+    out = df[list(PRICES.required_cols)]
     out = out.sort_values(["date", "symbol"]).reset_index(drop=True)
     return out
 
@@ -96,23 +255,32 @@ def load_fees(path: Path) -> pd.DataFrame:
       fees <= 0
       rebates >= 0
     """
-    df = read_any(path)
+    df = read_any(path, schema_hint=_FEES_READ_TYPES)
+    trusted = df.attrs.get("trusted", False)
 
     # basic normalization (keep it light, validation handles sign rules)
-    df = df.copy()
-    df.columns = [str(c).strip().lower() for c in df.columns]
+    out = normalize_fees(df)
 
-    # enforce required cols exist
-    missing = [c for c in FEES.required_cols if c not in df.columns]
-    if missing:
-        raise DataValidationError(f"fees: missing required columns: {missing}")
+    if not trusted:
+        validate_fees(out)
+    return out
 
-    df["trade_id"] = df["trade_id"].astype(str).str.strip()
-    df["fees"] = pd.to_numeric(df["fees"], errors="coerce")
-    df["rebates"] = pd.to_numeric(df["rebates"], errors="coerce")
 
-    validate_fees(df)
+# -----------------------------
+# Combined loader
+# -----------------------------
+def load_all(
+    fills_path: Path, prices_path: Path, fees_path: Path, *, tz: Optional[str] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Loads fills, prices and fees concurrently; returns (fills, prices, fees).
 
-    out = df.loc[:, list(FEES.required_cols)].copy()
-    out = out.reset_index(drop=True)
-    return out
+    The three loads are independent and mostly spent in PyArrow file decoding,
+    which releases the GIL, so a thread pool overlaps them. Prefer this over
+    calling the per-file loaders one after another.
+    """
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        fills = pool.submit(load_fills, fills_path, tz=tz)
+        prices = pool.submit(load_prices, prices_path, tz=tz)
+        fees = pool.submit(load_fees, fees_path)
+        return fills.result(), prices.result(), fees.result()
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+
+from data_validation import SIDE_CATEGORIES, DataValidationError
+from schemas import FILLS, PRICES
+
+
+# -----------------------------
+# Lazy scan
+# -----------------------------
+def _scan(path: Path, name: str, required_cols: tuple) -> pl.LazyFrame:
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+
+    suf = path.suffix.lower()
+    if suf == ".parquet":
+        lf = pl.scan_parquet(path)
+    elif suf == ".csv":
+        # read everything as text; casts below coerce bad values to null
+        lf = pl.scan_csv(path, infer_schema=False)
+    else:
+        raise ValueError(f"Unsupported document type: {suf}")
+
+    have = set(lf.collect_schema().names())
+    missing = [c for c in required_cols if c not in have]
+    if missing:
+        raise DataValidationError(f"{name}: missing required columns: {missing}")
+
+    return lf.select(list(required_cols))
+
+
+# Strings are parsed as ISO-8601 only, never with a format guessed from the
+# data (that read 01/02/2024 as 1 Feb): "YYYY-MM-DD[( |T)HH:MM:SS[.f]][Z|+HH:MM]",
+# naive values as UTC wall time. Anything else is null -> reported unparsable.
+_ISO_NAIVE = "%Y-%m-%d %H:%M:%S%.f"
+_ISO_OFFSET = "%Y-%m-%d %H:%M:%S%.f%z"
+
+
+def _iso_text(col: str) -> pl.Expr:
+    return (
+        pl.col(col)
+        .str.strip_chars()
+        .str.replace(r"^(\d{4}-\d{2}-\d{2})T", "${1} ")
+        .str.replace(r"Z$", "+00:00")
+    )
+
+
+def _utc(lf: pl.LazyFrame, col: str) -> pl.Expr:
+    if lf.collect_schema()[col] == pl.String:
+        text = _iso_text(col)
+        return pl.coalesce(
+            text.str.to_datetime(_ISO_OFFSET, time_unit="us", time_zone="UTC", strict=False),
+            text.str.to_datetime(_ISO_NAIVE, time_unit="us", time_zone="UTC", strict=False),
+        ).alias(col)
+    return pl.col(col).cast(pl.Datetime("us", "UTC"), strict=False)
+
+
+def _date(lf: pl.LazyFrame, col: str) -> pl.Expr:
+    if lf.collect_schema()[col] == pl.String:
+        text = _iso_text(col)
+        return pl.coalesce(
+            text.str.to_date("%Y-%m-%d", strict=False),
+            text.str.to_datetime(_ISO_NAIVE, strict=False).dt.date(),
+        ).alias(col)
+    return pl.col(col).cast(pl.Date, strict=False)
+
+
+def _check(lf: pl.LazyFrame, predicate: pl.Expr, msg: str) -> None:
+    if lf.filter(predicate).limit(1).collect().height:
+        raise DataValidationError(msg)
+
+
+def _finish(df: pl.DataFrame, as_pandas: bool) -> Union[pl.DataFrame, pd.DataFrame]:
+    if not as_pandas:
+        return df
+
+    # same dtypes as loaders.load_*: Arrow string (Polars hands out
+    # large_string), numpy float64, side as the B/S int8-coded categorical
+    tbl = df.to_arrow()
+    tbl = tbl.cast(pa.schema([
+        pa.field(f.name, pa.string())
+        if pa.types.is_large_string(f.type) or pa.types.is_string_view(f.type) else f
+        for f in tbl.schema
+    ]))
+    out = tbl.to_pandas(types_mapper=pd.ArrowDtype)
+    for col in out.columns:
+        if out[col].dtype == pd.ArrowDtype(pa.float64()):
+            out[col] = out[col].to_numpy(dtype=np.float64, na_value=np.nan)
+    if "side" in out.columns:
+        out["side"] = pd.Categorical(out["side"], categories=SIDE_CATEGORIES)
+    return out
+
+
+# -----------------------------
+# Loaders
+# -----------------------------
+def load_fills_polars(
+    path: Path, *, tz: Optional[str] = None, as_pandas: bool = False
+) -> Union[pl.DataFrame, pd.DataFrame]:
+    """
+    Polars counterpart of loaders.load_fills(): projection, casts, string
+    cleanup and the timestamp sort run as one lazy plan, then the
+    validate_fills() rules are checked against the collected frame.
+
+    Returns a Polars DataFrame unless as_pandas=True, in which case the frame
+    has the same dtypes as load_fills() output.
+    """
+    lf = _scan(path, "fills", FILLS.required_cols)
+    lf = lf.with_columns([
+        pl.col("trade_id").cast(pl.String).str.strip_chars(),
+        pl.col("symbol").cast(pl.String).str.strip_chars().str.to_uppercase(),
+        pl.col("side").cast(pl.String).str.strip_chars().str.to_uppercase(),
+        _utc(lf, "timestamp"),
+        pl.col("qty").cast(pl.Float64, strict=False),
+        pl.col("price").cast(pl.Float64, strict=False),
+    ])
+    if tz is not None:
+        lf = lf.with_columns(pl.col("timestamp").dt.convert_time_zone(tz))
+
+    out = lf.sort("timestamp").collect(engine="streaming")
+
+    # validate (same rules/messages as validate_fills)
+    chk = out.lazy()
+    _check(chk, pl.col("trade_id").is_null() | (pl.col("trade_id").str.len_bytes() == 0),
+           "fills: trade_id has empty/NaN values")
+
+    dups = chk.filter(pl.col("trade_id").is_duplicated())
+    dups = dups.select(pl.col("trade_id").unique()).collect()
+    if dups.height:
+        raise DataValidationError(f"fills: duplicate trade_ids: {dups['trade_id'].to_list()}")
+
+    _check(chk, pl.col("timestamp").is_null(), "fills: timestamp has unparsable values")
+
+    bad_side = chk.filter(~pl.col("side").is_in(["B", "S"]).fill_null(False))
+    bad_side = bad_side.select(pl.col("side").unique()).collect()
+    if bad_side.height:
+        raise DataValidationError(
+            f"fills: wrong or missing side values: {bad_side['side'].to_list()}"
+        )
+
+    _check(chk, ~(pl.col("qty") > 0).fill_null(False), "fills: qty must be numeric and > 0")
+    _check(chk, ~(pl.col("price") > 0).fill_null(False), "fills: price must be numeric and > 0")
+
+    return _finish(out, as_pandas)
+
+
+def load_prices_polars(
+    path: Path, *, tz: Optional[str] = None, as_pandas: bool = False
+) -> Union[pl.DataFrame, pd.DataFrame]:
+    """
+    Polars counterpart of loaders.load_prices(); see load_fills_polars().
+    """
+    lf = _scan(path, "prices", PRICES.required_cols)
+    lf = lf.with_columns([
+        pl.col("symbol").cast(pl.String).str.strip_chars().str.to_uppercase(),
+        _date(lf, "date"),
+        pl.col("close").cast(pl.Float64, strict=False),
+        _utc(lf, "timestamp"),
+    ])
+    if tz is not None:
+        lf = lf.with_columns(pl.col("timestamp").dt.convert_time_zone(tz))
+
+    out = lf.sort(["date", "symbol"]).collect(engine="streaming")
+
+    # validate (same rules/messages as validate_prices)
+    chk = out.lazy()
+    _check(chk, pl.col("date").is_null(), "prices: date has unparsable values")
+    _check(chk, pl.col("symbol").is_null() | (pl.col("symbol").str.len_bytes() == 0),
+           "prices: symbol has empty/NaN values")
+    _check(chk, ~(pl.col("close") > 0).fill_null(False), "prices: close must be numeric and > 0")
+    _check(chk, pl.struct("date", "symbol").is_duplicated(),
+           "prices: duplicate rows for (date, symbol)")
+
+    return _finish(out, as_pandas)
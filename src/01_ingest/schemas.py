@@ -1,47 +1,40 @@
 from __future__ import annotations
-from dataclasses import dataclass
-
-
-@dataclass(frozen=True)
-class FillsSchema:
-
-    """ FILLS SCHEMA """
-
-    required_cols = (
-        "trade_id",
-        "timestamp",
-        "symbol",
-        "side",
-        "qty",
-        "price",
-    )
-
-
-@dataclass(frozen=True)
-class PricesSchema:
-
-    """ PRICES SCHEMA """
-
-    required_cols = (
-        "date",
-        "symbol",
-        "close",  
-        "timestamp",     
-    )
-
-
-@dataclass(frozen=True)
-class FeesSchema:
-
-    """ FEES SCHEMA """
-    
-    required_cols = (
-        "trade_id", 
-        "fees",
-        "rebates",
-    )
-
-
-FILLS = FillsSchema()
-PRICES = PricesSchema()
-FEES = FeesSchema()
\ No newline at end of file
+from types import SimpleNamespace
+
+
+# FILLS SCHEMA
+FILLS_REQUIRED_COLS = (
+    "trade_id",
+    "timestamp",
+    "symbol",
+    "side",
+    "qty",
+    "price",
+)
+FILLS_REQUIRED_SET = frozenset(FILLS_REQUIRED_COLS)
+
+
+# PRICES SCHEMA
+PRICES_REQUIRED_COLS = (
+    "date",
+    "symbol",
+    "close",
+    "timestamp",
+)
+PRICES_REQUIRED_SET = frozenset(PRICES_REQUIRED_COLS)
+
+
+# FEES SCHEMA
+FEES_REQUIRED_COLS = (
+    "trade_id",
+    "fees",
+    "rebates",
+)
+FEES_REQUIRED_SET = frozenset(FEES_REQUIRED_COLS)
+
+
+# attribute access kept for callers (FILLS.required_cols etc.);
+# required_cols for ordered access, required_set for membership tests
+FILLS = SimpleNamespace(required_cols=FILLS_REQUIRED_COLS, required_set=FILLS_REQUIRED_SET)
+PRICES = SimpleNamespace(required_cols=PRICES_REQUIRED_COLS, required_set=PRICES_REQUIRED_SET)
+FEES = SimpleNamespace(required_cols=FEES_REQUIRED_COLS, required_set=FEES_REQUIRED_SET)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# the ingest modules import each other as top-level modules (see loaders.py)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src" / "01_ingest"))
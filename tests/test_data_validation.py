@@ -0,0 +1,94 @@
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from data_validation import (
+    UTC_TIMESTAMP,
+    DataValidationError,
+    _encode_side,
+    _parse_timestamp_utc,
+    normalize_fills,
+    validate_fills,
+)
+
+UTC = pd.ArrowDtype(UTC_TIMESTAMP)
+
+
+def ts(*values):
+    return [pd.Timestamp(v, tz="UTC") if v is not None else None for v in values]
+
+
+def arrow(values, type_):
+    return pd.Series(pd.arrays.ArrowExtensionArray(pa.array(values, type_)))
+
+
+@pytest.mark.parametrize("values, expected", [
+    pytest.param(["2024-01-02T14:30:00+01:00", "2024-01-02T14:30:00Z"],
+                 ts("2024-01-02 13:30", "2024-01-02 14:30"), id="offset"),
+    pytest.param(["2024-01-02 14:30:00", "2024-01-02T14:30:01"],
+                 ts("2024-01-02 14:30:00", "2024-01-02 14:30:01"), id="naive-as-utc"),
+    pytest.param(["2024-01-02 14:30:00", "2024-01-02T14:30:00+01:00"],
+                 ts("2024-01-02 14:30", "2024-01-02 13:30"), id="mixed-naive-and-offset"),
+    pytest.param(["2024-01-02T14:30:00.123456Z", "2024-01-02T14:30:00.5Z"],
+                 ts("2024-01-02 14:30:00.123456", "2024-01-02 14:30:00.5"), id="fractional"),
+    pytest.param(["2024-01-02T14:30:00Z", "not a time", None],
+                 ts("2024-01-02 14:30", None, None), id="bad-to-nat"),
+])
+def test_strings(values, expected):
+    out = _parse_timestamp_utc(pd.Series(values))
+    assert out.dtype == UTC
+    assert out.tolist() == pd.Series(expected, dtype=UTC).tolist()
+
+
+@pytest.mark.parametrize("s", [
+    pytest.param(pd.Series(pd.to_datetime(["2024-01-02 14:30:00.123456789"], utc=True)),
+                 id="datetime64-ns"),
+    pytest.param(pd.Series(pd.to_datetime(["2024-01-02 09:30:00.123456"]).tz_localize("America/New_York")),
+                 id="datetime64-other-zone"),
+    pytest.param(pd.Series(pd.to_datetime(["2024-01-02 14:30:00.123456"])), id="datetime64-naive"),
+    pytest.param(arrow([1704205800123456789], pa.timestamp("ns", tz="UTC")), id="arrow-ns"),
+    pytest.param(arrow([1704205800123], pa.timestamp("ms")), id="arrow-ms-naive"),
+    pytest.param(pd.Series([pd.Timestamp("2024-01-02 14:30:00.123456")], dtype=object), id="object"),
+])
+def test_non_strings_land_on_us_utc(s):
+    out = _parse_timestamp_utc(s)
+    assert out.dtype == UTC
+    # ns inputs are truncated to us; everything is the same instant
+    assert out.iloc[0].floor("ms") == pd.Timestamp("2024-01-02 14:30:00.123", tz="UTC")
+
+
+def test_canonical_input_returned_as_is():
+    s = arrow([1704205800000000], UTC_TIMESTAMP)
+    assert _parse_timestamp_utc(s) is s
+
+
+def test_ns_truncated_to_us():
+    s = pd.Series(pd.to_datetime(["2024-01-02 14:30:00.123456789"], utc=True))
+    assert _parse_timestamp_utc(s).iloc[0] == pd.Timestamp("2024-01-02 14:30:00.123456", tz="UTC")
+
+
+def test_encode_side_int8_codes():
+    out = _encode_side(pd.Series([" b", "S", "s "]))
+    assert list(out.cat.categories) == ["B", "S"]
+    assert out.cat.codes.dtype == "int8"
+    assert out.cat.codes.tolist() == [0, 1, 1]
+
+
+def test_encode_side_keeps_unknown_and_null():
+    out = _encode_side(pd.Series(["B", "x", None, "X"]))
+    assert list(out.cat.categories) == ["B", "S", "X"]
+    assert out.tolist()[:2] == ["B", "X"] and pd.isna(out.iloc[2])
+
+
+def test_bad_side_values_listed_in_error():
+    n = 4
+    df = pd.DataFrame({
+        "trade_id": [f"T{i}" for i in range(n)],
+        "timestamp": ["2024-01-02T14:30:00Z"] * n,
+        "symbol": ["AAPL"] * n,
+        "side": ["B", " x", None, "S"],
+        "qty": [1.0] * n,
+        "price": [100.0] * n,
+    })
+    with pytest.raises(DataValidationError, match=r"wrong or missing side values: \['X', nan\]"):
+        validate_fills(normalize_fills(df))
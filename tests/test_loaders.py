@@ -0,0 +1,80 @@
+import datetime as dt
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as papq
+import pytest
+
+from data_validation import DataValidationError
+from loaders import _FILLS_READ_TYPES, load_all, load_fees, load_fills, load_prices
+
+JAN2 = dt.date(2024, 1, 2)
+
+
+FILLS_CSV = """trade_id,timestamp,symbol,side,qty,price
+T2,2024-01-02T14:30:02Z,msft,S,5,370.1
+T1,2024-01-02T14:30:01Z, aapl ,b,10,185.25
+"""
+
+FEES_CSV = """Trade_ID , FEES,Rebates
+T1,-0.5,0.1
+T2,-0.25,0.0
+"""
+
+
+def _write_prices_csv(path, dates, close="10.5"):
+    rows = [f"{d},aapl,{close},2024-01-02T21:00:00Z" for d in dates]
+    path.write_text("date,symbol,close,timestamp\n" + "\n".join(rows) + "\n")
+    return path
+
+
+# the last two fail the date32 hint and take the CSV fallback read
+@pytest.mark.parametrize("date", ["2024-01-02", "01/02/2024", "2024-01-02 00:00:00"])
+def test_prices_csv_date_is_date32(tmp_path, date):
+    out = load_prices(_write_prices_csv(tmp_path / "prices.csv", [date]))
+    assert out["date"].dtype == pd.ArrowDtype(pa.date32())
+    assert out["date"].tolist() == [JAN2]
+
+
+def test_prices_parquet_datetime_date_is_date32(tmp_path):
+    path = tmp_path / "prices.parquet"
+    df = pd.DataFrame({
+        "date": pd.to_datetime(["2024-01-02", "2024-01-03"]),
+        "symbol": ["AAPL", "AAPL"],
+        "close": [10.5, 10.6],
+        "timestamp": pd.to_datetime(["2024-01-02 21:00", "2024-01-03 21:00"], utc=True),
+    })
+    papq.write_table(pa.Table.from_pandas(df, preserve_index=False), path)
+
+    out = load_prices(path)
+    assert out["date"].dtype == pd.ArrowDtype(pa.date32())
+    assert out["date"].tolist() == [JAN2, dt.date(2024, 1, 3)]
+
+
+def test_load_all_matches_sequential_loaders(tmp_path):
+    fills = tmp_path / "fills.csv"
+    fills.write_text(FILLS_CSV)
+    prices = _write_prices_csv(tmp_path / "prices.csv", ["2024-01-02", "2024-01-03"])
+    fees = tmp_path / "fees.csv"
+    fees.write_text(FEES_CSV)
+
+    got = load_all(fills, prices, fees, tz="America/New_York")
+    want = (
+        load_fills(fills, tz="America/New_York"),
+        load_prices(prices, tz="America/New_York"),
+        load_fees(fees),
+    )
+    for g, w in zip(got, want):
+        pd.testing.assert_frame_equal(g, w)
+    assert got[0]["side"].cat.codes.tolist() == [0, 1]  # sorted: T1 (B), T2 (S)
+
+
+def test_fills_csv_non_numeric_qty_falls_back_and_fails_validation(tmp_path):
+    path = tmp_path / "fills.csv"
+    path.write_text(FILLS_CSV.replace(",10,", ",ten,"))
+
+    with pytest.raises(pa.ArrowInvalid):
+        pacsv.read_csv(path, convert_options=pacsv.ConvertOptions(column_types=_FILLS_READ_TYPES))
+    with pytest.raises(DataValidationError, match="qty must be numeric and > 0"):
+        load_fills(path)
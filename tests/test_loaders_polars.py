@@ -0,0 +1,89 @@
+import pandas as pd
+import pytest
+
+pl = pytest.importorskip("polars")
+
+from data_validation import DataValidationError
+from loaders import load_fills, load_prices, write_parquet
+from loaders_polars import load_fills_polars, load_prices_polars
+
+
+@pytest.fixture
+def write_csv(tmp_path):
+    def write(name, header, *rows):
+        path = tmp_path / name
+        path.write_text("\n".join((header,) + rows) + "\n")
+        return path
+    return write
+
+
+def _assert_parity(pandas_out, polars_out):
+    pd.testing.assert_frame_equal(polars_out, pandas_out)
+
+
+@pytest.fixture
+def fills_csv(write_csv):
+    # offset, naive (UTC wall time), fractional and space-separated layouts mixed
+    return write_csv(
+        "fills.csv",
+        "trade_id,timestamp,symbol,side,qty,price",
+        "T3,2024-01-02T15:30:00.250+01:00,msft,S,5,370.1",
+        "T1,2024-01-02 14:30:00, aapl ,b,10,185.25",
+        "T2,2024-01-02T14:30:00.5Z,aapl,S,2.5,185.5",
+    )
+
+
+@pytest.fixture
+def prices_csv(write_csv):
+    return write_csv(
+        "prices.csv",
+        "date,symbol,close,timestamp",
+        "2024-01-03,aapl,186.0,2024-01-03T21:00:00Z",
+        "2024-01-02 00:00:00,aapl,185.0,2024-01-02 21:00:00",
+    )
+
+
+@pytest.mark.parametrize("tz", [None, "America/New_York"])
+def test_fills_csv_parity(fills_csv, tz):
+    _assert_parity(load_fills(fills_csv, tz=tz), load_fills_polars(fills_csv, tz=tz, as_pandas=True))
+
+
+@pytest.mark.parametrize("tz", [None, "America/New_York"])
+def test_prices_csv_parity(prices_csv, tz):
+    _assert_parity(load_prices(prices_csv, tz=tz), load_prices_polars(prices_csv, tz=tz, as_pandas=True))
+
+
+def test_parquet_parity(tmp_path, fills_csv, prices_csv):
+    fills, prices = tmp_path / "fills.parquet", tmp_path / "prices.parquet"
+    write_parquet(load_fills(fills_csv), fills, sorted_by="timestamp")
+    write_parquet(load_prices(prices_csv), prices)
+
+    _assert_parity(load_fills(fills), load_fills_polars(fills, as_pandas=True))
+    _assert_parity(load_prices(prices), load_prices_polars(prices, as_pandas=True))
+
+
+def test_non_iso_date_rejected_not_guessed(write_csv):
+    # pandas reads this month-first; a guessed format here read it as 1 Feb
+    path = write_csv(
+        "prices.csv",
+        "date,symbol,close,timestamp",
+        "01/02/2024,aapl,185.0,2024-01-02T21:00:00Z",
+    )
+    with pytest.raises(DataValidationError, match="date has unparsable values"):
+        load_prices_polars(path)
+
+
+def test_non_iso_timestamp_rejected(write_csv):
+    path = write_csv(
+        "fills.csv",
+        "trade_id,timestamp,symbol,side,qty,price",
+        "T1,01/02/2024 14:30,aapl,B,10,185.25",
+    )
+    with pytest.raises(DataValidationError, match="timestamp has unparsable values"):
+        load_fills_polars(path)
+
+
+def test_as_pandas_side_is_int8_categorical(fills_csv):
+    side = load_fills_polars(fills_csv, as_pandas=True)["side"]
+    assert list(side.cat.categories) == ["B", "S"]
+    assert side.cat.codes.dtype == "int8"
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as papq
+import pytest
+
+import loaders
+from data_validation import DataValidationError
+from loaders import load_fills, read_any, write_parquet
+
+
+def _fills(n: int, *, qty: float = 1.0, reverse: bool = False) -> pd.DataFrame:
+    ts = pd.date_range("2024-01-02 14:30", periods=n, freq="s", tz="UTC")
+    if reverse:
+        ts = ts[::-1]
+    return pd.DataFrame({
+        "trade_id": [f"T{i:04d}" for i in range(n)],
+        "timestamp": ts,
+        "symbol": ["AAPL", "MSFT"] * (n // 2) + ["AAPL"] * (n % 2),
+        "side": ["B", "S"] * (n // 2) + ["B"] * (n % 2),
+        "qty": np.full(n, qty),
+        "price": np.linspace(100.0, 101.0, n),
+    })
+
+
+@pytest.fixture
+def fills_csv(tmp_path):
+    path = tmp_path / "fills.csv"
+    _fills(8, reverse=True).to_csv(path, index=False)
+    return path
+
+
+def _boom(*args, **kwargs):
+    raise AssertionError("should have been skipped")
+
+
+def test_stamped_parquet_skips_validation_and_sort(tmp_path, fills_csv, monkeypatch):
+    path = tmp_path / "fills.parquet"
+    expected = load_fills(fills_csv)
+    write_parquet(expected, path, sorted_by="timestamp")
+
+    assert read_any(path).attrs == {"presorted": "timestamp", "trusted": True}
+
+    monkeypatch.setattr(loaders, "validate_fills", _boom)
+    monkeypatch.setattr(pd.DataFrame, "sort_values", _boom)
+    monkeypatch.setattr(pd.Series, "is_monotonic_increasing", property(_boom))
+    out = load_fills(path)
+
+    pd.testing.assert_frame_equal(out, expected)
+
+
+@pytest.mark.parametrize("col, row, value, msg", [
+    ("trade_id", 1, "T0000", "duplicate trade_ids"),
+    ("qty", 2, -5.0, "qty must be numeric and > 0"),
+    ("qty", 3, np.nan, "qty must be numeric and > 0"),
+    ("side", 0, "X", "wrong or missing side values"),
+])
+def test_write_parquet_rejects_invalid_frame(tmp_path, col, row, value, msg):
+    path = tmp_path / "fills.parquet"
+    df = _fills(4)
+    df.loc[row, col] = value
+
+    with pytest.raises(DataValidationError, match=msg):
+        write_parquet(df, path)
+    assert not path.exists()
+
+
+def test_write_parquet_rejects_unknown_schema(tmp_path):
+    with pytest.raises(DataValidationError, match="match no fills/prices/fees schema"):
+        write_parquet(pd.DataFrame({"a": [1]}), tmp_path / "x.parquet")
+
+
+def test_unstamped_parquet_is_validated(tmp_path):
+    path = tmp_path / "fills.parquet"
+    papq.write_table(pa.Table.from_pandas(_fills(4, qty=0.0), preserve_index=False), path)
+
+    assert "trusted" not in read_any(path).attrs
+    with pytest.raises(DataValidationError, match="qty must be numeric and > 0"):
+        load_fills(path)
+
+
+def test_sorted_by_spans_row_groups(tmp_path):
+    path = tmp_path / "fills.parquet"
+    write_parquet(_fills(10), path, sorted_by="timestamp", row_group_size=3)
+
+    assert papq.ParquetFile(path).metadata.num_row_groups == 4
+    assert read_any(path).attrs["presorted"] == "timestamp"
+
+
+def test_sorted_by_rejects_unsorted_frame(tmp_path):
+    path = tmp_path / "fills.parquet"
+
+    with pytest.raises(ValueError, match="not sorted by 'timestamp'"):
+        write_parquet(_fills(10, reverse=True), path, sorted_by="timestamp")
+    assert not path.exists()
+
+
+@pytest.mark.parametrize("row_group_size", [None, 3])
+def test_sorting_columns_from_other_writers_ignored(tmp_path, row_group_size):
+    # a foreign file declaring a sort it doesn't have, in one or several row groups
+    path = tmp_path / "fills.parquet"
+    tbl = pa.Table.from_pandas(_fills(10, reverse=True), preserve_index=False)
+    sorting = [papq.SortingColumn(tbl.schema.get_field_index("timestamp"))]
+    papq.write_table(tbl, path, row_group_size=row_group_size, sorting_columns=sorting)
+
+    assert "presorted" not in read_any(path).attrs
+    out = load_fills(path)
+    assert out["timestamp"].is_monotonic_increasing
+    assert out["trade_id"].iloc[0] == "T0009"